@@ -5,14 +5,18 @@ import os
 import re
 import json
 import time
-import glob
+import asyncio
+import contextvars
 import hashlib
 import datetime
 from dataclasses import dataclass
+from html.parser import HTMLParser
 from typing import List, Dict, Optional, Tuple, Set
 
 import requests
-from playwright.sync_api import sync_playwright, TimeoutError as PWTimeoutError
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from playwright.async_api import async_playwright, TimeoutError as PWTimeoutError
 
 
 # ----------------------------
@@ -24,13 +28,82 @@ SEEN_FILE = os.path.join(STATE_DIR, "seen.json")
 DEBUG_NOTIFIED_FILE = os.path.join(STATE_DIR, "debug_notified.json")
 DEBUG_DIR = "debug"
 
+# 사이트별 seen 최대 보관 개수(상태 파일이 실행마다 계속 커지지 않도록)
+SEEN_MAX_PER_SITE = 2000
+
+# 정적 HTML 경로로 수집하는 사이트: item_id를 URL만으로 계산
+# - 같은 링크라도 정적 HTML 텍스트와 브라우저 innerText가 다를 수 있고(CSS로 숨긴 텍스트, text-transform 등)
+#   게시판 제목의 [종료]/[진행중] 같은 표기도 바뀌므로, 제목이 달라질 때마다 신규로 재알림되지 않도록
+URL_ID_SITES = {"lensme", "isha", "lenbling", "yourly", "idol", "ann365"}
+
 OPS_WEBHOOK = os.environ.get("SLACK_WEBHOOK_URL", "").strip()         # 운영(신규 알림)
 TEST_WEBHOOK = os.environ.get("SLACK_WEBHOOK_URL_TEST", "").strip()   # 테스트(경고 알림)
 
 RUN_URL = os.environ.get("GITHUB_RUN_URL", "").strip()  # optional, workflow에서 env로 넘기면 좋음
 
+# debug 폴더는 workflow가 매번 커밋/업로드하므로 최신 파일만 이 개수까지 보관
+DEBUG_KEEP_MAX = 50
+DEBUG_TS_RE = re.compile(r"_(\d{8}_\d{6})")  # ts_tag() 형식
+
+# debug 스크린샷은 비싸서(렌더+인코딩) 필요할 때만: SCRAPER_DEBUG=1
+DEBUG_SCREENSHOT = os.environ.get("SCRAPER_DEBUG", "").strip() not in ("", "0")
+
 DEFAULT_TIMEOUT_MS = 25_000
 NAV_TIMEOUT_MS = 35_000
+SETTLE_TIMEOUT_MS = 3_000  # goto 이후 “렌더 안정” 대기 상한(고정 sleep 대체)
+NETWORKIDLE_MAX_MS = 1_000  # 그중 networkidle 몫의 상한(트래커가 많은 쇼핑몰은 잘 잠잠해지지 않음)
+# 사이트 1개 수집 전체 상한(초). 개별 timeout이 누적돼도 한 사이트가 실행 전체를 잡아두지 않도록
+# - 시간이 다 되면 코루틴은 취소되지만 이미 스레드에서 돌고 있는 requests 호출은 취소되지 않음.
+#   그래서 정적 요청 timeout을 남은 시간으로 줄여 둠(fetch_html) → 엄밀한 상한은 아니고 대략 이 정도
+SITE_BUDGET_SEC = 120
+# 브라우저 자리(pool의 context) 대기 상한(초). 대기 시간은 SITE_BUDGET_SEC에서 빼고 자리를 얻으면 예산을 새로 시작.
+# 사이트 1개 최악 = 정적 수집(예산) + 자리 대기(이 값) + 브라우저 수집(예산) ≈ 7분 → workflow 12분 제한 안쪽
+SLOT_WAIT_SEC = 180
+
+# 동시에 수집하는 사이트 수(= 돌려 쓰는 context 수, 브라우저는 1개)
+MAX_CONCURRENCY = 4
+
+# collect_anchors()용: ElementHandle.get_attribute / inner_text / img[alt]와 같은 값
+# - 제목 값(item_id)이 바뀌지 않도록 text는 innerText 유지. 다만 textContent가 비어 있으면
+#   (이미지만 있는 링크 등) innerText도 공백뿐이므로 레이아웃이 필요한 innerText 호출 생략
+ANCHORS_JS = """
+(els) => els.map(a => {
+    const img = a.querySelector('img[alt]');
+    return {
+        href: a.getAttribute('href') || '',
+        text: (a.textContent || '').trim() ? (a.innerText || '') : '',
+        aria: a.getAttribute('aria-label') || '',
+        alt: img ? (img.getAttribute('alt') || '') : '',
+    };
+})
+"""
+
+# 수집에 필요 없는 폰트/동영상은 URL 확장자로만 골라 요청 단계에서 차단
+# - 모든 요청에 route를 걸면 통과시킬 문서/스크립트/XHR까지 요청마다 Python 왕복이 생김
+# - 이미지는 실행 옵션 --blink-settings=imagesEnabled=false로 이미 로드되지 않음(img 태그/alt는 DOM에 남음)
+# - stylesheet는 차단하지 않음: 제목으로 쓰는 innerText가 CSS 기준 표시 여부를 따르므로
+#   차단하면 숨은 텍스트가 제목에 섞여 item_id가 바뀜(= 기존 항목이 신규로 재알림)
+BLOCKED_URL_RE = re.compile(r"\.(?:woff2?|ttf|otf|eot|mp4|webm|m3u8|mp3)(?:[?#]|$)", re.IGNORECASE)
+
+CHROMIUM_ARGS = [
+    "--disable-dev-shm-usage",
+    # 이미지 디코딩/페인트 생략(img[alt] 등 DOM 속성은 그대로 남음)
+    "--blink-settings=imagesEnabled=false",
+    # 화면에 보이지 않는 수집용 브라우저라 필요 없는 기능 끄기(메모리/백그라운드 CPU 절감)
+    "--disable-gpu",
+    "--disable-extensions",
+    "--disable-background-networking",
+    "--disable-sync",
+    "--disable-default-apps",
+    "--disable-translate",
+    "--mute-audio",
+]
+
+USER_AGENT = (
+    "Mozilla/5.0 (X11; Linux x86_64) "
+    "AppleWebKit/537.36 (KHTML, like Gecko) "
+    "Chrome/122.0.0.0 Safari/537.36"
+)
 
 # “경고로 볼지” 판단을 더 엄격하게(=불필요 경고 줄이기)
 # - 아래 조건을 만족하면 debug를 만들어도 경고를 보내지 않음
@@ -45,51 +118,112 @@ def ensure_dirs():
     os.makedirs(STATE_DIR, exist_ok=True)
     os.makedirs(DEBUG_DIR, exist_ok=True)
 
+# Actions는 UTC 기반이지만 표시는 KST로
+KST = datetime.timezone(datetime.timedelta(hours=9))
+
 def now_kst_str() -> str:
-    # Actions는 UTC 기반이지만 표시는 KST로
-    kst = datetime.timezone(datetime.timedelta(hours=9))
-    return datetime.datetime.now(tz=kst).strftime("%Y-%m-%d %H:%M:%S KST")
+    return datetime.datetime.now(tz=KST).strftime("%Y-%m-%d %H:%M:%S KST")
 
 def ts_tag() -> str:
-    return datetime.datetime.utcnow().strftime("%Y%m%d_%H%M%S")
+    # debug 파일명용 UTC 타임스탬프
+    return time.strftime("%Y%m%d_%H%M%S", time.gmtime())
 
 def stable_id(site_key: str, url: str, title: str = "") -> str:
     s = f"{site_key}::{url}::{title}".encode("utf-8")
     return hashlib.sha1(s).hexdigest()[:16]
 
+# path -> 마지막으로 읽거나 쓴 파일 내용(변경 없으면 다시 쓰지 않기 위함)
+_json_on_disk: Dict[str, str] = {}
+
 def load_json(path: str, default):
     if not os.path.exists(path):
         return default
     try:
         with open(path, "r", encoding="utf-8") as f:
-            return json.load(f)
+            text = f.read()
+        _json_on_disk[path] = text
+        return json.loads(text)
     except Exception:
         return default
 
-def save_json(path: str, data):
+def save_json(path: str, data) -> bool:
+    """
+    tmp 파일에 쓴 뒤 os.replace로 교체(중간에 죽어도 기존 파일은 온전).
+    직렬화 결과가 디스크 내용과 같으면 쓰지 않음. 반환: 실제로 썼는지 여부
+    """
+    text = json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+    if _json_on_disk.get(path) == text:
+        return False
     tmp = path + ".tmp"
     with open(tmp, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+        f.write(text)
     os.replace(tmp, path)
+    _json_on_disk[path] = text
+    return True
+
+def make_slack_session() -> requests.Session:
+    """
+    연결 실패와 429만 지수 백오프로 재시도(429의 Retry-After 존중).
+    POST는 urllib3 기본 재시도 대상이 아니라 allowed_methods에 명시.
+    읽기 실패/5xx는 webhook이 이미 메시지를 받았을 수 있으므로 재시도하지 않음(중복 알림 방지)
+    """
+    retry = Retry(
+        total=5,
+        connect=5,
+        read=0,
+        other=0,
+        backoff_factor=0.5,
+        status_forcelist=[429],
+        allowed_methods=frozenset(["POST"]),
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(max_retries=retry))
+    return session
+
+SLACK_SESSION = make_slack_session()
 
 def post_slack(webhook: str, text: str):
     if not webhook:
         print("[slack] webhook not set, skip")
         return
     try:
-        resp = requests.post(webhook, json={"text": text}, timeout=15)
+        resp = SLACK_SESSION.post(webhook, json={"text": text}, timeout=15)
         if resp.status_code >= 400:
             print(f"[slack] failed {resp.status_code}: {resp.text[:200]}")
     except Exception as e:
         print(f"[slack] exception: {e}")
 
 def list_debug_files() -> List[str]:
-    files = []
-    if os.path.isdir(DEBUG_DIR):
-        for p in glob.glob(os.path.join(DEBUG_DIR, "*")):
-            if os.path.isfile(p):
-                files.append(os.path.basename(p))
-    return sorted(files)
+    # scandir: 파일 여부를 디렉터리 항목 정보로 판단(파일마다 stat 호출 안 함)
+    try:
+        with os.scandir(DEBUG_DIR) as it:
+            return sorted(e.name for e in it if e.is_file())
+    except FileNotFoundError:
+        return []
+
+def prune_debug_files(keep: int) -> List[str]:
+    """
+    debug 파일을 파일명의 ts_tag 기준 최신 keep개만 남기고 삭제(체크아웃하면 mtime이 모두 같아서 파일명 기준).
+    반환: 남은 파일 목록
+    """
+    files = list_debug_files()
+    if len(files) <= keep:
+        return files
+
+    def ts_of(fn: str) -> str:
+        m = DEBUG_TS_RE.search(fn)
+        return m.group(1) if m else ""
+
+    files.sort(key=ts_of)
+    for fn in files[:-keep]:
+        try:
+            os.remove(os.path.join(DEBUG_DIR, fn))
+        except OSError:
+            pass
+    print(f"[debug] pruned {len(files) - keep} old files")
+    return sorted(files[-keep:])
 
 def save_debug_text(name_prefix: str, content: str) -> str:
     fn = f"{name_prefix}_{ts_tag()}.txt"
@@ -99,38 +233,98 @@ def save_debug_text(name_prefix: str, content: str) -> str:
     print(f"[debug] saved {path}")
     return fn
 
-def save_debug_html_png(page, name_prefix: str) -> Tuple[str, str]:
+async def save_debug_page(page, name_prefix: str) -> Tuple[str, str]:
+    """
+    HTML은 항상 저장(가볍고 구조 변경 분석에 충분).
+    스크린샷은 SCRAPER_DEBUG가 켜진 경우에만, full_page PNG 대신 뷰포트 JPEG로.
+    반환: (html_fn, shot_fn) — 저장 못 한 쪽은 ""
+    """
     html_fn = f"{name_prefix}_{ts_tag()}.html"
-    png_fn = f"{name_prefix}_{ts_tag()}.png"
-
     html_path = os.path.join(DEBUG_DIR, html_fn)
-    png_path = os.path.join(DEBUG_DIR, png_fn)
 
     try:
-        html = page.content()
+        html = await page.content()
         with open(html_path, "w", encoding="utf-8") as f:
             f.write(html)
-        page.screenshot(path=png_path, full_page=True)
-        print(f"[debug] saved {png_path} {html_path}")
+        print(f"[debug] saved {html_path}")
     except Exception as e:
         # 최소한 텍스트라도 남김
         save_debug_text(name_prefix + "_exception", str(e))
         return ("", "")
 
-    return (html_fn, png_fn)
+    if not DEBUG_SCREENSHOT:
+        return (html_fn, "")
 
-def safe_goto(page, url: str, label: str):
+    shot_fn = f"{name_prefix}_{ts_tag()}.jpg"
+    shot_path = os.path.join(DEBUG_DIR, shot_fn)
+    try:
+        # 애니메이션/캐럿 정지: 배너 슬라이드가 멈출 때까지 기다리지 않고 바로 캡처
+        await page.screenshot(
+            path=shot_path, full_page=False, type="jpeg", quality=60,
+            animations="disabled", caret="hide",
+        )
+        print(f"[debug] saved {shot_path}")
+    except Exception as e:
+        print(f"[debug] screenshot failed: {e}")
+        return (html_fn, "")
+
+    return (html_fn, shot_fn)
+
+async def safe_goto(page, url: str, label: str):
     print(f"[goto][{label}] {url}")
-    return page.goto(url, wait_until="domcontentloaded", timeout=NAV_TIMEOUT_MS)
+    return await page.goto(url, wait_until="domcontentloaded", timeout=NAV_TIMEOUT_MS)
+
+async def wait_settled(page, selector: Optional[str] = None, timeout_ms: int = SETTLE_TIMEOUT_MS):
+    """
+    고정 sleep 대신 사용: (selector가 있으면) 그 요소가 붙고 네트워크가 잠잠해질 때까지 대기.
+    두 단계가 timeout_ms 하나를 나눠 씀(전체 상한 = timeout_ms), networkidle은 그중 최대 NETWORKIDLE_MAX_MS.
+    시간 초과는 실패가 아니라 “그냥 진행”으로 처리하고, selector가 늦어도 남은 시간만큼은 networkidle 대기.
+    """
+    deadline = time.monotonic() + timeout_ms / 1000
+    if selector:
+        try:
+            await page.wait_for_selector(selector, state="attached", timeout=timeout_ms)
+        except PWTimeoutError:
+            pass
+
+    remaining_ms = min(NETWORKIDLE_MAX_MS, int((deadline - time.monotonic()) * 1000))
+    if remaining_ms <= 0:
+        # Playwright에서 timeout=0은 “무제한”이므로 남은 시간이 없으면 호출하지 않음
+        return
+    try:
+        await page.wait_for_load_state("networkidle", timeout=remaining_ms)
+    except PWTimeoutError:
+        pass
+
+async def collect_anchors(page, selector: str = "a[href]") -> List[Dict[str, str]]:
+    """
+    selector에 맞는 링크의 href/텍스트/aria-label/img alt를 evaluate_all 한 번으로 가져옴
+    (요소마다 get_attribute/inner_text를 부르면 링크 수만큼 브라우저 왕복이 생김)
+    locator를 쓰므로 selector에 Playwright 문법(:has-text 등)도 사용 가능
+    """
+    return await page.locator(selector).evaluate_all(ANCHORS_JS)
+
+WS_RE = re.compile(r"\s+")
 
 def norm_text(s: str) -> str:
-    return re.sub(r"\s+", " ", (s or "").strip())
+    return WS_RE.sub(" ", (s or "").strip())
+
+# 같은 글인데 유입 경로만 다른 링크가 별개 항목(= 재알림)이 되지 않도록 제거할 쿼리 파라미터
+TRACKING_PARAM_PREFIXES = ("utm_", "fbclid=", "gclid=")
+
+def strip_tracking_params(url: str) -> str:
+    head, sep, rest = url.partition("?")
+    if not sep:
+        return url
+    query, hsep, frag = rest.partition("#")
+    kept = [kv for kv in query.split("&") if kv and not kv.lower().startswith(TRACKING_PARAM_PREFIXES)]
+    return head + ("?" + "&".join(kept) if kept else "") + hsep + frag
 
 def abs_url(base: str, href: str) -> str:
     if not href:
         return ""
     href = href.strip()
-    if href.startswith("http://") or href.startswith("https://"):
+    if href.startswith(("http://", "https://")):
         return href
     if href.startswith("//"):
         return "https:" + href
@@ -139,6 +333,146 @@ def abs_url(base: str, href: str) -> str:
     return base.rstrip("/") + "/" + href
 
 
+# ----------------------------
+# 정적 HTML 수집(JS가 필요 없는 게시판은 브라우저 없이)
+# ----------------------------
+
+class AnchorCollector(HTMLParser):
+    """
+    서버가 내려준 HTML에서 a[href]를 collect_anchors()와 같은 모양의 dict로 추출.
+    text는 innerText에 가깝게 만듦: script/style 내용 제외, 블록 태그/br 경계는 줄바꿈,
+    CSS 파일 없이 알 수 있는 숨김(hidden 속성, inline display:none, Cafe24 .displaynone)은 제외.
+    stylesheet 규칙/text-transform까지는 재현하지 않으므로 정적 경로 사이트는 item_id에 제목을 쓰지 않음(URL_ID_SITES)
+    """
+    SKIP_TAGS = {"script", "style", "noscript", "template"}
+    VOID_TAGS = {"area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta", "source", "track", "wbr"}
+    HIDDEN_STYLE_RE = re.compile(r"display\s*:\s*none|visibility\s*:\s*hidden", re.IGNORECASE)
+    BLOCK_TAGS = {
+        "br", "p", "div", "li", "ul", "ol", "dl", "dt", "dd", "table", "tr", "td", "th",
+        "h1", "h2", "h3", "h4", "h5", "h6", "section", "article", "header", "footer",
+    }
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.anchors: List[Dict[str, str]] = []
+        self._cur: Optional[Dict[str, str]] = None
+        self._text: List[str] = []
+        self._img_alt_found = False
+        self._skip_depth = 0
+        # 숨김 요소: 시작 태그 이름과 같은 태그 중첩 수(끝 태그 짝 맞추기용)
+        self._hidden_tag: Optional[str] = None
+        self._hidden_nest = 0
+
+    @classmethod
+    def is_hidden(cls, attr: Dict[str, Optional[str]]) -> bool:
+        if "hidden" in attr:
+            return True
+        if "displaynone" in (attr.get("class") or "").split():
+            return True
+        return bool(cls.HIDDEN_STYLE_RE.search(attr.get("style") or ""))
+
+    def _close_anchor(self):
+        if self._cur is not None:
+            self._cur["text"] = "".join(self._text)
+            self.anchors.append(self._cur)
+        self._cur = None
+        self._text = []
+        self._img_alt_found = False
+
+    def handle_starttag(self, tag, attrs):
+        if tag in self.SKIP_TAGS:
+            self._skip_depth += 1
+            return
+        attr = dict(attrs)
+        if self._hidden_tag is not None:
+            if tag == self._hidden_tag:
+                self._hidden_nest += 1
+        elif tag not in self.VOID_TAGS and self.is_hidden(attr):
+            self._hidden_tag = tag
+            self._hidden_nest = 1
+        if tag == "a":
+            self._close_anchor()  # 닫히지 않은 a 정리
+            if "href" in attr:
+                self._cur = {
+                    "href": attr["href"] or "",
+                    "text": "",
+                    "aria": attr.get("aria-label") or "",
+                    "alt": "",
+                }
+            return
+        if self._cur is None:
+            return
+        if tag == "img" and "alt" in attr and not self._img_alt_found:
+            # querySelector('img[alt]')처럼 alt 속성이 있는 첫 img
+            self._cur["alt"] = attr["alt"] or ""
+            self._img_alt_found = True
+        elif tag in self.BLOCK_TAGS and self._hidden_tag is None:
+            self._text.append("\n")
+
+    def handle_endtag(self, tag):
+        if self._hidden_tag is not None and tag == self._hidden_tag:
+            self._hidden_nest -= 1
+            if self._hidden_nest == 0:
+                self._hidden_tag = None
+        if tag in self.SKIP_TAGS:
+            self._skip_depth = max(0, self._skip_depth - 1)
+        elif tag == "a":
+            self._close_anchor()
+        elif self._cur is not None and tag in self.BLOCK_TAGS and self._hidden_tag is None:
+            self._text.append("\n")
+
+    def handle_data(self, data):
+        if self._cur is not None and self._skip_depth == 0 and self._hidden_tag is None:
+            self._text.append(data)
+
+    def close(self):
+        super().close()
+        self._close_anchor()
+
+def make_page_session() -> requests.Session:
+    # 같은 호스트로 여러 번 요청(ann365 페이지 순회 등)하므로 keep-alive 연결 재사용
+    session = requests.Session()
+    session.headers.update({"User-Agent": USER_AGENT, "Accept-Language": "ko-KR,ko;q=0.9"})
+    return session
+
+PAGE_SESSION = make_page_session()
+
+# 지금 수집 중인 사이트의 마감 시각(loop.time() 기준 = time.monotonic()). run_site()가 설정하고,
+# asyncio.to_thread는 contextvars를 복사하므로 스레드에서 도는 fetch_html에서도 읽힘
+SITE_DEADLINE: contextvars.ContextVar[Optional[float]] = contextvars.ContextVar("SITE_DEADLINE", default=None)
+
+def fetch_html(url: str) -> str:
+    timeout = NAV_TIMEOUT_MS / 1000
+    deadline = SITE_DEADLINE.get()
+    if deadline is not None:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise TimeoutError("site budget exhausted")
+        # requests의 timeout은 연결/읽기 단계별 상한이라 전체 시간을 정확히 자르지는 못함
+        timeout = min(timeout, remaining)
+    resp = PAGE_SESSION.get(url, timeout=timeout)
+    resp.raise_for_status()
+    if not resp.encoding or resp.encoding.lower() == "iso-8859-1":
+        # charset 헤더가 없으면 requests 기본값(latin-1) 대신 본문 기준 추정(EUC-KR 게시판 대비)
+        resp.encoding = resp.apparent_encoding
+    return resp.text
+
+async def fetch_anchors_static(url: str, label: str) -> List[Dict[str, str]]:
+    """
+    브라우저 없이 HTML만 받아서 a[href] 목록 추출. 실패하면 [] (호출 측이 브라우저로 fallback)
+    """
+    print(f"[http][{label}] {url}")
+    try:
+        html = await asyncio.to_thread(fetch_html, url)
+    except Exception as e:
+        print(f"[http][{label}] failed: {e!r}")
+        return []
+    parser = AnchorCollector()
+    parser.feed(html)
+    parser.close()
+    return parser.anchors
+
+
 # ----------------------------
 # 데이터 모델
 # ----------------------------
@@ -152,12 +486,13 @@ class Item:
     item_id: str
 
 def make_item(site_key: str, site_name: str, title: str, url: str) -> Item:
+    # url은 호출하는 쪽에서 strip_tracking_params까지 마친 값(중복 제거 키와 item_id가 같은 URL을 쓰도록)
     return Item(
         site_key=site_key,
         site_name=site_name,
         title=norm_text(title) if title else "(제목 미확인)",
         url=url,
-        item_id=stable_id(site_key, url, title or "")
+        item_id=stable_id(site_key, url, "" if site_key in URL_ID_SITES else (title or ""))
     )
 
 
@@ -165,120 +500,137 @@ def make_item(site_key: str, site_name: str, title: str, url: str) -> Item:
 # 수집기(사이트별)
 # ----------------------------
 
-def scrape_olens(page) -> List[Item]:
+# 사이트별 기준 URL(목록/링크 절대경로화/DNS 미리 조회에 공통 사용)
+SITE_BASE_URLS = {
+    "olens": "https://o-lens.com",
+    "hapakristin": "https://hapakristin.co.kr",
+    "lensme": "https://www.lens-me.com",
+    "myfipn": "https://www.myfipn.com",
+    "chuulens": "https://chuulens.kr",
+    "gemhour": "https://gemhour.co.kr",
+    "isha": "https://i-sha.kr",
+    "lenbling": "https://lenbling.com",
+    "yourly": "https://yourly.kr",
+    "idol": "https://www.i-dol.kr",
+    "ann365": "https://ann365.com",
+}
+
+async def scrape_olens(get_page) -> List[Item]:
     site_key = "olens"
     site_name = "오렌즈"
-    url = "https://o-lens.com/event/list"
+    base = SITE_BASE_URLS[site_key]
+    url = base + "/event/list"
 
-    safe_goto(page, url, "olens_list")
-    page.wait_for_timeout(1200)
+    page = await get_page()
+    await safe_goto(page, url, "olens_list")
+    await wait_settled(page, "a[href*='/event']")
 
-    items: List[Item] = []
+    # (url, title) = item_id와 같은 기준으로 수집 중 중복 제거(dict라 순서도 유지)
+    items: Dict[Tuple[str, str], Item] = {}
     # 카드/리스트 내 링크 수집
-    anchors = page.query_selector_all("a[href]")
-    for a in anchors:
-        href = a.get_attribute("href") or ""
-        full = abs_url("https://o-lens.com", href)
-        if "/event/" not in full and "/event" not in full:
+    # - 브라우저 쪽에서 event 링크만 골라 넘김(메뉴/푸터 링크는 직렬화·innerText 생략)
+    # - 상대경로(event/...)도 잡히도록 '/event'가 아니라 'event'로 고르고, 최종 판단은 아래에서
+    for a in await collect_anchors(page, "a[href*='event']"):
+        full = strip_tracking_params(abs_url(base, a["href"]))
+        if "/event" not in full:
             continue
-        t = a.inner_text() or ""
-        t = norm_text(t)
+        t = norm_text(a["text"])
         if not t:
             continue
-        items.append(make_item(site_key, site_name, t, full))
-
-    # 중복 제거
-    uniq = {}
-    for it in items:
-        uniq[it.item_id] = it
-    return list(uniq.values())
+        if (full, t) in items:
+            continue
+        items[(full, t)] = make_item(site_key, site_name, t, full)
 
-def scrape_list_page(page, site_key: str, site_name: str, list_url: str, base: str, allow_patterns: List[str]) -> List[Item]:
-    safe_goto(page, list_url, "list")
-    page.wait_for_timeout(1000)
+    return list(items.values())
 
-    anchors = page.query_selector_all("a[href]")
-    items: List[Item] = []
+def list_items_from_anchors(anchors: List[Dict[str, str]], site_key: str, site_name: str, base: str, allow_re: re.Pattern) -> List[Item]:
+    # 목록 사이트는 item_id가 URL 기준(URL_ID_SITES)이므로 중복 제거도 URL로(첫 제목 유지)
+    items: Dict[str, Item] = {}
 
     for a in anchors:
-        href = a.get_attribute("href") or ""
-        full = abs_url(base, href)
+        full = strip_tracking_params(abs_url(base, a["href"]))
         if not full:
             continue
-        ok = any((re.search(p, full) is not None) for p in allow_patterns)
-        if not ok:
+        if not allow_re.search(full):
             continue
 
-        title = a.inner_text() or ""
-        title = norm_text(title)
+        title = norm_text(a["text"])
         if not title:
             # 이미지 링크인 경우 aria-label/alt 일부 추출 시도
-            aria = a.get_attribute("aria-label") or ""
-            title = norm_text(aria)
+            title = norm_text(a["aria"])
         if not title:
             continue
+        if full in items:
+            continue
+        items[full] = make_item(site_key, site_name, title, full)
 
-        items.append(make_item(site_key, site_name, title, full))
-
-    uniq = {}
-    for it in items:
-        uniq[it.item_id] = it
-    print(f"[list] found: {len(uniq)}")
-    return list(uniq.values())
-
-def scrape_banner(page, site_key: str, site_name: str, home_url: str, base: str, allow_patterns: List[str]) -> List[Item]:
-    safe_goto(page, home_url, "banner")
-    page.wait_for_timeout(1500)
+    return list(items.values())
 
-    items: List[Item] = []
+async def scrape_list_page(get_page, site_key: str, site_name: str, list_url: str, base: str, allow_re: re.Pattern, post_re: re.Pattern) -> List[Item]:
+    """
+    서버 렌더링 게시판이라 HTML만으로 충분한 경우가 대부분 → 브라우저 없이 먼저 시도.
+    정적 결과에 실제 게시글 링크(post_re)가 없으면 브라우저로 다시 수집
+    (메뉴/상품 링크도 allow_re에 걸리므로 “결과 0개”만으로는 JS 렌더링 게시판을 놓침)
+    """
+    anchors = await fetch_anchors_static(list_url, "list")
+    items = list_items_from_anchors(anchors, site_key, site_name, base, allow_re)
+
+    if not any(post_re.search(it.url) for it in items):
+        page = await get_page()
+        await safe_goto(page, list_url, "list")
+        await wait_settled(page)
+        anchors = await collect_anchors(page)
+        browser_items = list_items_from_anchors(anchors, site_key, site_name, base, allow_re)
+        # 브라우저로도 게시글이 없으면(빈 게시판 등) 정적 결과가 있으면 그대로 사용
+        if browser_items or not items:
+            items = browser_items
+
+    print(f"[list] found: {len(items)}")
+    return items
+
+async def scrape_banner(get_page, site_key: str, site_name: str, home_url: str, base: str, allow_re: re.Pattern) -> List[Item]:
+    page = await get_page()
+    await safe_goto(page, home_url, "banner")
+    await wait_settled(page, "a[href] img")
+
+    items: Dict[Tuple[str, str], Item] = {}
     # 배너는 보통 a 또는 swiper-slide 내부 a
-    anchors = page.query_selector_all("a[href]")
-    for a in anchors:
-        href = a.get_attribute("href") or ""
-        full = abs_url(base, href)
+    for a in await collect_anchors(page):
+        full = strip_tracking_params(abs_url(base, a["href"]))
         if not full:
             continue
-        ok = any((re.search(p, full) is not None) for p in allow_patterns)
-        if not ok:
+        if not allow_re.search(full):
             continue
 
         # 배너는 텍스트가 없을 수 있으니 alt/aria-label 우선
-        title = a.get_attribute("aria-label") or ""
-        if not title:
-            img = a.query_selector("img[alt]")
-            if img:
-                title = img.get_attribute("alt") or ""
-        if not title:
-            title = a.inner_text() or ""
+        title = a["aria"] or a["alt"] or a["text"]
         title = norm_text(title) or "(배너)"
+        if (full, title) in items:
+            continue
+        items[(full, title)] = make_item(site_key, site_name, title, full)
 
-        items.append(make_item(site_key, site_name, title, full))
-
-    uniq = {}
-    for it in items:
-        uniq[it.item_id] = it
-    print(f"[banner] found: {len(uniq)}")
-    return list(uniq.values())
+    print(f"[banner] found: {len(items)}")
+    return list(items.values())
 
-def hapakristin_event_page_looks_ok(page) -> bool:
+async def hapakristin_event_page_looks_ok(page) -> bool:
     """
     하파크리스틴은 Playwright에서 status가 404로 찍혀도 SPA 쉘이 로드되는 경우가 있습니다.
     따라서 status만으로 실패 처리하지 않고, 페이지 정황을 보고 “정상 로드”를 판단합니다.
     """
     try:
-        title = page.title() or ""
+        # 전체 HTML을 가져오지 않고 브라우저 안에서 바로 확인
+        title = await page.title() or ""
         url = page.url or ""
-        html = page.content() or ""
+        app_ok = bool(await page.evaluate("() => !!document.getElementById('app')"))
     except Exception:
         return False
 
     title_ok = ("이벤트 페이지" in title) or ("Hapa Kristin" in title)
     url_ok = ("/events/" in url)
-    app_ok = ('id="app"' in html) or ('id="app"' in html.lower())
     # 이벤트 페이지는 보통 /events/<id>로 유지되고, app root가 존재
     return (title_ok and url_ok and app_ok)
 
-def scrape_hapakristin(page) -> Tuple[List[Item], bool]:
+async def scrape_hapakristin(get_page) -> Tuple[List[Item], bool]:
     """
     반환: (items, had_hard_failure)
     - 하드 실패: 고정 URL도 못 모으거나(0개), 페이지 로딩이 아예 깨진 경우
@@ -286,22 +638,20 @@ def scrape_hapakristin(page) -> Tuple[List[Item], bool]:
     """
     site_key = "hapakristin"
     site_name = "하파크리스틴"
-    home = "https://hapakristin.co.kr/"
-
-    safe_goto(page, home, "hapakristin_home")
-    page.wait_for_timeout(1500)
 
+    # 이벤트 URL을 이미 알고 있으므로 홈을 거치지 않고 바로 이동
     # 1) 우선 고정 URL 2개를 기준으로 “진짜 진행중 이벤트”를 확보
     fixed_ids = HAPAKRISTIN_FIXED_EVENT_IDS[:]
-    fixed_urls = [f"https://hapakristin.co.kr/events/{i}" for i in fixed_ids]
+    fixed_urls = [f"{SITE_BASE_URLS[site_key]}/events/{i}" for i in fixed_ids]
 
+    page = await get_page()
     fixed_ok = True
     fixed_items: List[Item] = []
     # 이벤트 페이지 접근은 “상태코드”가 아니라 “페이지 정황”으로 OK 판단
     for i, u in zip(fixed_ids, fixed_urls):
-        resp = safe_goto(page, u, f"hapakristin_check_{i}")
-        page.wait_for_timeout(1000)
-        if not hapakristin_event_page_looks_ok(page):
+        resp = await safe_goto(page, u, f"hapakristin_check_{i}")
+        await wait_settled(page, "#app")
+        if not await hapakristin_event_page_looks_ok(page):
             fixed_ok = False
 
         # 제목은 페이지 내부에서 안정적으로 뽑기 어려울 수 있어, ID 기반 타이틀로
@@ -315,11 +665,11 @@ def scrape_hapakristin(page) -> Tuple[List[Item], bool]:
 
     # 2) 고정 URL이 “정황상 실패”로 보이면, 그때만 추가 진단/디버그
     #    (이 경우에만 debug 생성 + 테스트 채널 경고 대상)
-    html_fn, png_fn = save_debug_html_png(page, "hapakristin_fixed_url_bad")
+    html_fn, shot_fn = await save_debug_page(page, "hapakristin_fixed_url_bad")
     info = []
     for u in fixed_urls:
         try:
-            r = page.goto(u, wait_until="domcontentloaded", timeout=NAV_TIMEOUT_MS)
+            r = await page.goto(u, wait_until="domcontentloaded", timeout=NAV_TIMEOUT_MS)
             status = r.status if r else None
             info.append(f"{u} status={status}")
         except Exception as e:
@@ -334,115 +684,204 @@ def scrape_hapakristin(page) -> Tuple[List[Item], bool]:
     # - 대신 경고는 “새 debug 생성” 기준으로만 1회 발송
     return (fixed_items, True)
 
-def scrape_lensme(page) -> List[Item]:
-    return scrape_list_page(
-        page=page,
+# 사이트별 허용 URL 패턴(모듈 로드 시 한 번만 컴파일, 사이트당 하나의 alternation → URL당 search 1번)
+LENSME_ALLOW = re.compile("|".join([
+    r"/shop/board\.php\?ps_bbscuid=17",
+    r"/shop/board\.php\?ps_bbspuid=",
+]))
+MYFIPN_ALLOW = re.compile("|".join([
+    r"/event",
+    r"/promotion",
+    r"/board",
+    r"/pages",
+    r"/collections",
+    r"/product",
+    r"/products",
+]))
+CHUULENS_ALLOW = re.compile("|".join([
+    r"/event",
+    r"/promotion",
+    r"/board",
+    r"/product",
+    r"/products",
+]))
+GEMHOUR_ALLOW = re.compile("|".join([
+    r"/event",
+    r"/promotion",
+    r"/board",
+    r"/product",
+    r"/products",
+]))
+ISHA_ALLOW = re.compile("|".join([
+    r"/board/",
+    r"/article/",
+    r"/product/",
+]))
+LENBLING_ALLOW = re.compile("|".join([
+    r"/board/event/",
+    r"/article/",
+    r"/product/",
+]))
+YOURLY_ALLOW = re.compile("|".join([
+    r"/board/event",
+    r"/article/",
+    r"/product/",
+]))
+IDOL_ALLOW = re.compile("|".join([
+    r"/bbs/event",
+    r"/bbs/board",
+    r"/shop/item",
+    r"/product",
+]))
+
+# 목록 사이트의 “실제 게시글” 링크(정적 HTML 결과를 믿을지 판단용, allow 패턴의 부분집합)
+LENSME_POST = re.compile(r"ps_uid=\d+")
+# (공지사항/예약주문방법 글, 상품 링크는 모든 페이지에 있으므로 이벤트 게시판 글만)
+ISHA_POST = re.compile(r"/article/%EC%9D%B4%EB%B2%A4%ED%8A%B8/")  # /article/이벤트/
+LENBLING_POST = re.compile(r"/article/event/")
+YOURLY_POST = re.compile(r"/board/event/view/\d+")
+IDOL_POST = re.compile(r"/bbs/board\.php\?[^#]*wr_id=\d+")
+# ann365: 페이지 번호(pg=) 링크가 아닌 contact_event 링크
+ANN365_POST = re.compile(r"contact_event\.php\?(?![^#]*\bpg=)")
+
+async def scrape_lensme(get_page) -> List[Item]:
+    return await scrape_list_page(
+        get_page=get_page,
         site_key="lensme",
         site_name="렌즈미",
-        list_url="https://www.lens-me.com/shop/board.php?ps_bbscuid=17",
-        base="https://www.lens-me.com",
-        allow_patterns=[r"/shop/board\.php\?ps_bbscuid=17", r"/shop/board\.php\?ps_bbspuid="],
+        list_url=SITE_BASE_URLS["lensme"] + "/shop/board.php?ps_bbscuid=17",
+        base=SITE_BASE_URLS["lensme"],
+        allow_re=LENSME_ALLOW,
+        post_re=LENSME_POST,
     )
 
-def scrape_myfipn(page) -> List[Item]:
-    return scrape_banner(
-        page=page,
+async def scrape_myfipn(get_page) -> List[Item]:
+    return await scrape_banner(
+        get_page=get_page,
         site_key="myfipn",
         site_name="마이피픈",
-        home_url="https://www.myfipn.com/",
-        base="https://www.myfipn.com",
-        allow_patterns=[r"/event", r"/promotion", r"/board", r"/pages", r"/collections", r"/product", r"/products"],
+        home_url=SITE_BASE_URLS["myfipn"] + "/",
+        base=SITE_BASE_URLS["myfipn"],
+        allow_re=MYFIPN_ALLOW,
     )
 
-def scrape_chuulens(page) -> List[Item]:
-    return scrape_banner(
-        page=page,
+async def scrape_chuulens(get_page) -> List[Item]:
+    return await scrape_banner(
+        get_page=get_page,
         site_key="chuulens",
         site_name="츄렌즈",
-        home_url="https://chuulens.kr/",
-        base="https://chuulens.kr",
-        allow_patterns=[r"/event", r"/promotion", r"/board", r"/product", r"/products"],
+        home_url=SITE_BASE_URLS["chuulens"] + "/",
+        base=SITE_BASE_URLS["chuulens"],
+        allow_re=CHUULENS_ALLOW,
     )
 
-def scrape_gemhour(page) -> List[Item]:
-    return scrape_banner(
-        page=page,
+async def scrape_gemhour(get_page) -> List[Item]:
+    return await scrape_banner(
+        get_page=get_page,
         site_key="gemhour",
         site_name="젬아워",
-        home_url="https://gemhour.co.kr/",
-        base="https://gemhour.co.kr",
-        allow_patterns=[r"/event", r"/promotion", r"/board", r"/product", r"/products"],
+        home_url=SITE_BASE_URLS["gemhour"] + "/",
+        base=SITE_BASE_URLS["gemhour"],
+        allow_re=GEMHOUR_ALLOW,
     )
 
-def scrape_isha(page) -> List[Item]:
-    return scrape_list_page(
-        page=page,
+async def scrape_isha(get_page) -> List[Item]:
+    return await scrape_list_page(
+        get_page=get_page,
         site_key="isha",
         site_name="아이샤",
-        list_url="https://i-sha.kr/board/%EC%9D%B4%EB%B2%A4%ED%8A%B8/8/",
-        base="https://i-sha.kr",
-        allow_patterns=[r"/board/", r"/article/", r"/product/"],
+        list_url=SITE_BASE_URLS["isha"] + "/board/%EC%9D%B4%EB%B2%A4%ED%8A%B8/8/",
+        base=SITE_BASE_URLS["isha"],
+        allow_re=ISHA_ALLOW,
+        post_re=ISHA_POST,
     )
 
-def scrape_lenbling(page) -> List[Item]:
-    return scrape_list_page(
-        page=page,
+async def scrape_lenbling(get_page) -> List[Item]:
+    return await scrape_list_page(
+        get_page=get_page,
         site_key="lenbling",
         site_name="렌블링",
-        list_url="https://lenbling.com/board/event/8/",
-        base="https://lenbling.com",
-        allow_patterns=[r"/board/event/", r"/article/", r"/product/"],
+        list_url=SITE_BASE_URLS["lenbling"] + "/board/event/8/",
+        base=SITE_BASE_URLS["lenbling"],
+        allow_re=LENBLING_ALLOW,
+        post_re=LENBLING_POST,
     )
 
-def scrape_yourly(page) -> List[Item]:
-    return scrape_list_page(
-        page=page,
+async def scrape_yourly(get_page) -> List[Item]:
+    return await scrape_list_page(
+        get_page=get_page,
         site_key="yourly",
         site_name="유어리",
-        list_url="https://yourly.kr/board/event",
-        base="https://yourly.kr",
-        allow_patterns=[r"/board/event", r"/article/", r"/product/"],
+        list_url=SITE_BASE_URLS["yourly"] + "/board/event",
+        base=SITE_BASE_URLS["yourly"],
+        allow_re=YOURLY_ALLOW,
+        post_re=YOURLY_POST,
     )
 
-def scrape_idol(page) -> List[Item]:
+async def scrape_idol(get_page) -> List[Item]:
     # i-dol -> 아이돌렌즈
-    return scrape_list_page(
-        page=page,
+    return await scrape_list_page(
+        get_page=get_page,
         site_key="idol",
         site_name="아이돌렌즈",
-        list_url="https://www.i-dol.kr/bbs/event1.php",
-        base="https://www.i-dol.kr",
-        allow_patterns=[r"/bbs/event", r"/bbs/board", r"/shop/item", r"/product"],
+        list_url=SITE_BASE_URLS["idol"] + "/bbs/event1.php",
+        base=SITE_BASE_URLS["idol"],
+        allow_re=IDOL_ALLOW,
+        post_re=IDOL_POST,
     )
 
-def scrape_ann365(page) -> Tuple[List[Item], bool]:
+async def scrape_ann365(get_page) -> Tuple[List[Item], bool]:
     """
     ann365: 이벤트 모음 페이지
     - code는 알 수 없으니, 리스트에서 실제 event 링크를 수집(상대/절대 모두)
     - 여러 페이지 순회하되, 연속 empty 페이지가 나오면 중단
     반환: (items, had_hard_failure)
     """
+    async def fetch_static(url: str) -> List[Dict[str, str]]:
+        return await fetch_anchors_static(url, "ann365_list")
+
+    async def fetch_browser(url: str) -> List[Dict[str, str]]:
+        page = await get_page()
+        await safe_goto(page, url, "ann365_list")
+        await wait_settled(page)
+        return await collect_anchors(page)
+
+    # 목록은 서버 렌더링 → 브라우저 없이 먼저, 이벤트 글 링크(ANN365_POST)가 없으면 브라우저로 다시
+    items = await collect_ann365_pages(fetch_static)
+    if not any(ANN365_POST.search(it.url) for it in items):
+        browser_items = await collect_ann365_pages(fetch_browser)
+        if browser_items or not items:
+            items = browser_items
+
+    if len(items) == 0:
+        # 진짜로 못 긁은 경우에만 debug + 하드 실패
+        html_fn, shot_fn = await save_debug_page(await get_page(), "ann365_no_results")
+        return (items, True)
+
+    print(f"[ann365] events found: {len(items)}")
+    return (items, False)
+
+async def collect_ann365_pages(fetch) -> List[Item]:
+    """
+    fetch(url) -> anchors 로 목록 페이지를 차례로 읽음(정적 HTML/브라우저 공용)
+    """
     site_key = "ann365"
     site_name = "앤365"
-    base = "https://ann365.com"
-    list_tpl = "https://ann365.com/contact/contact_event.php?code=$code&scategory=&pg={pg}"
+    base = SITE_BASE_URLS[site_key]
+    list_tpl = base + "/contact/contact_event.php?code=$code&scategory=&pg={pg}"
 
-    items: List[Item] = []
+    items: Dict[str, Item] = {}  # URL 기준(URL_ID_SITES)
     empty_streak = 0
     max_pages = 20  # 안전장치
 
     for pg in range(1, max_pages + 1):
         url = list_tpl.format(pg=pg)
-        safe_goto(page, url, "ann365_list")
-        page.wait_for_timeout(900)
 
         # 링크 수집(이벤트 상세는 code 파라미터 또는 별도 링크일 수 있음)
-        anchors = page.query_selector_all("a[href]")
         found_this_page = 0
 
-        for a in anchors:
-            href = a.get_attribute("href") or ""
-            full = abs_url(base, href)
+        for a in await fetch(url):
+            full = strip_tracking_params(abs_url(base, a["href"]))
 
             # 이벤트/프로모션 관련 링크만(너무 넓히면 잡음이 많아짐)
             if not full:
@@ -450,13 +889,13 @@ def scrape_ann365(page) -> Tuple[List[Item], bool]:
             if ("contact_event" not in full) and ("event" not in full):
                 continue
 
-            title = a.inner_text() or ""
-            title = norm_text(title)
+            title = norm_text(a["text"])
             if not title:
                 continue
-
-            it = make_item(site_key, site_name, title, full)
-            items.append(it)
+            # 앞 페이지에서 이미 본 링크(공통 메뉴 등)는 이 페이지의 수집으로 치지 않음
+            if full in items:
+                continue
+            items[full] = make_item(site_key, site_name, title, full)
             found_this_page += 1
 
         if found_this_page == 0:
@@ -467,19 +906,7 @@ def scrape_ann365(page) -> Tuple[List[Item], bool]:
         else:
             empty_streak = 0
 
-    # 중복 제거
-    uniq = {}
-    for it in items:
-        uniq[it.item_id] = it
-    items = list(uniq.values())
-
-    if len(items) == 0:
-        # 진짜로 못 긁은 경우에만 debug + 하드 실패
-        html_fn, png_fn = save_debug_html_png(page, "ann365_no_results")
-        return (items, True)
-
-    print(f"[ann365] events found: {len(items)}")
-    return (items, False)
+    return list(items.values())
 
 
 # ----------------------------
@@ -513,20 +940,198 @@ def format_new_items_message(new_items: List[Item]) -> str:
 
     return "\n".join(lines)
 
-def format_debug_warning(site_name: str, new_debug_files: List[str]) -> str:
+def format_debug_warning(buckets: Dict[str, List[str]]) -> str:
+    # 사이트별로 따로 보내지 않고 한 메시지로
     lines = []
-    lines.append(f"[수집 경고] {site_name}")
+    lines.append(f"[수집 경고] {', '.join(buckets)}")
     lines.append("debug 파일이 새로 생성되었습니다(수집 실패/구조 변경 가능).")
-    lines.append("새 debug: " + ", ".join(new_debug_files[:15]))
+    for site_name, new_debug_files in buckets.items():
+        lines.append(f"- {site_name} 새 debug: " + ", ".join(new_debug_files[:15]))
     if RUN_URL:
         lines.append(f"Run: {RUN_URL}")
     return "\n".join(lines)
 
-def main():
+async def abort_route(route):
+    await route.abort()
+
+async def new_context(browser):
+    context = await browser.new_context(
+        viewport={"width": 1400, "height": 900},
+        user_agent=USER_AGENT,
+        locale="ko-KR",
+        # 서비스 워커가 등록되면 탐색 사이에도 백그라운드 작업이 돌아서 차단
+        service_workers="block",
+    )
+    await context.route(BLOCKED_URL_RE, abort_route)
+    return context
+
+async def run_site(browser, pool: asyncio.Queue, site_key: str, site_name: str, fn) -> Tuple[List[Item], bool]:
+    """
+    사이트 1개 수집. 브라우저가 필요해지는 시점(get_page 첫 호출)에만 pool에서 context를 빌려
+    page를 열고, 끝나면 page만 닫고 반납. (pool 크기 = 동시 수집 수)
+    수집 시간 상한은 SITE_BUDGET_SEC, 자리 대기 시간은 따로 SLOT_WAIT_SEC로 제한.
+    정적 HTML로 끝나는 사이트는 context를 빌리지 않으므로 브라우저 사이트의 자리를 차지하지 않음.
+    예외가 난 context는 쿠키/스토리지 상태를 믿을 수 없으니 버리고 다음 사용 때 새로 생성.
+    반환: (items, had_hard_failure)
+    """
+    print(f"[main] site: {site_name} ( {site_key} )")
+
+    t0 = time.time()
+    items: List[Item] = []
+    hard_fail = False
+    discard_context = False
+
+    borrowed = False
+    context = None
+    page = None
+
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + SITE_BUDGET_SEC
+    budget = asyncio.timeout_at(deadline)
+    slot_wait_expired = False
+
+    async def get_page():
+        nonlocal borrowed, context, page, slot_wait_expired
+        if page is None:
+            # 다른 사이트가 자리를 쓰는 동안 기다린 시간 때문에 예산 초과가 나지 않도록
+            # 대기 중에는 예산을 멈추고 SLOT_WAIT_SEC로만 제한, 자리를 얻으면 예산 재시작
+            budget.reschedule(None)
+            try:
+                async with asyncio.timeout(SLOT_WAIT_SEC):
+                    context = await pool.get()
+            except TimeoutError:
+                slot_wait_expired = True
+                raise
+            borrowed = True
+            new_deadline = loop.time() + SITE_BUDGET_SEC
+            budget.reschedule(new_deadline)
+            SITE_DEADLINE.set(new_deadline)
+            if context is None:
+                context = await new_context(browser)
+            page = await context.new_page()
+            page.set_default_timeout(DEFAULT_TIMEOUT_MS)
+        return page
+
+    SITE_DEADLINE.set(deadline)
+    try:
+        async with budget:
+            if site_key in ("hapakristin", "ann365"):
+                # 특별 처리: (items, had_hard_failure) 반환
+                items, hard_fail = await fn(get_page)
+            else:
+                items = await fn(get_page)
+    except PWTimeoutError as e:
+        hard_fail = True
+        discard_context = True
+        save_debug_text(f"{site_key}_timeout", str(e))
+    except asyncio.TimeoutError:
+        # 상한 초과: 수집 중단(부분 결과도 버림 → seen 변경 없음)
+        hard_fail = True
+        discard_context = True
+        if slot_wait_expired:
+            save_debug_text(f"{site_key}_timeout", f"no browser slot within {SLOT_WAIT_SEC}s")
+        else:
+            save_debug_text(f"{site_key}_timeout", f"site budget exceeded ({SITE_BUDGET_SEC}s)")
+    except Exception as e:
+        hard_fail = True
+        discard_context = True
+        save_debug_text(f"{site_key}_exception", repr(e))
+    finally:
+        if page is not None:
+            try:
+                await page.close()
+            except Exception:
+                discard_context = True
+        if borrowed:
+            if discard_context and context is not None:
+                try:
+                    await context.close()
+                except Exception:
+                    pass
+                context = None
+            pool.put_nowait(context)
+
+    elapsed = time.time() - t0
+    print(f"[main][{site_key}] scraped: {len(items)} elapsed={elapsed:.1f}s")
+    return (items, hard_fail)
+
+SITES = [
+    ("olens", "오렌즈", scrape_olens),
+    ("hapakristin", "하파크리스틴", scrape_hapakristin),
+    ("lensme", "렌즈미", scrape_lensme),
+    ("myfipn", "마이피픈", scrape_myfipn),
+    ("chuulens", "츄렌즈", scrape_chuulens),
+    ("gemhour", "젬아워", scrape_gemhour),
+    ("isha", "아이샤", scrape_isha),
+    ("lenbling", "렌블링", scrape_lenbling),
+    ("yourly", "유어리", scrape_yourly),
+    ("idol", "아이돌렌즈", scrape_idol),
+    ("ann365", "앤365", scrape_ann365),
+]
+
+def migrate_url_id_seen(seen: Dict) -> bool:
+    """
+    URL_ID_SITES의 이전 형식 항목({title,url,first_seen}, 제목 포함 item_id)을 URL 기준 item_id로 1회 변환.
+    같은 URL이 제목만 달리 여러 번 저장돼 있으면 하나로 합침(가장 먼저 본 first_seen 유지).
+    이미 변환된 항목(값이 문자열)은 그대로. 반환: 변경 여부
+    """
+    changed = False
+    for site_key in URL_ID_SITES:
+        site_seen = seen.get(site_key)
+        if not isinstance(site_seen, dict):
+            continue
+        migrated: Dict[str, str] = {}
+        for item_id, v in site_seen.items():
+            if isinstance(v, dict) and v.get("url"):
+                new_id = stable_id(site_key, strip_tracking_params(v["url"]))
+                first_seen = v.get("first_seen") or ""
+                prev = migrated.get(new_id)
+                # now_kst_str 형식은 문자열 비교 = 시간 순서
+                migrated[new_id] = min(prev, first_seen) if prev and first_seen else (prev or first_seen)
+                changed = True
+            else:
+                migrated.setdefault(item_id, v)
+        seen[site_key] = migrated
+    return changed
+
+# debug 파일명 prefix(site_key) -> 사이트 표시 이름
+SITE_NAMES = {site_key: site_name for site_key, site_name, _ in SITES}
+
+async def slack_notifier(queue: asyncio.Queue):
+    """
+    (webhook, text)를 받아 순서대로 전송하는 백그라운드 작업. None을 받으면 종료.
+    메시지를 넣은 쪽은 전송 완료를 기다리지 않고 다음 작업(상태 저장 등)을 진행
+    """
+    while True:
+        msg = await queue.get()
+        if msg is None:
+            return
+        webhook, text = msg
+        await asyncio.to_thread(post_slack, webhook, text)
+
+# 실행 시작 시 DNS를 미리 조회할 호스트(SITE_BASE_URLS에서 뽑으므로 사이트 추가 시 따로 손댈 필요 없음)
+SITE_HOSTS = [u.partition("://")[2] for u in SITE_BASE_URLS.values()]
+# DNS 미리 조회는 최선 노력: resolver가 느려도 이 시간 이상은 수집 시작을 미루지 않음
+DNS_PREWARM_WAIT_SEC = 2
+
+async def prewarm_dns(hosts: List[str]):
+    """
+    브라우저 기동과 겹쳐서 모든 호스트 DNS를 동시에 조회(러너의 resolver 캐시를 채워 둠).
+    실패해도 상관없음(실제 접속 때 다시 조회)
+    """
+    loop = asyncio.get_running_loop()
+    await asyncio.gather(*[loop.getaddrinfo(h, 443) for h in hosts], return_exceptions=True)
+
+async def run_once(notify_q: asyncio.Queue):
+    """
+    수집 → 신규 판정 → 상태 저장 → debug 정리. 알림은 notify_q에 넣기만 함(전송은 slack_notifier)
+    """
     ensure_dirs()
 
     seen = load_json(SEEN_FILE, {})
-    # 구조: { site_key: { item_id: {title,url,first_seen} } }
+    # 구조: { site_key: { item_id: first_seen } }
+    # - item_id(16자리 해시)만으로 신규 판정하므로 title/url은 저장하지 않음
+    #   (이전 형식 { item_id: {title,url,first_seen} } 도 key만 보므로 그대로 호환)
     if not isinstance(seen, dict):
         seen = {}
 
@@ -537,99 +1142,78 @@ def main():
     debug_before = set(list_debug_files())
 
     new_items_all: List[Item] = []
-    had_any_state_change = False
-
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True, args=["--disable-dev-shm-usage"])
-        context = browser.new_context(
-            viewport={"width": 1400, "height": 900},
-            user_agent=(
-                "Mozilla/5.0 (X11; Linux x86_64) "
-                "AppleWebKit/537.36 (KHTML, like Gecko) "
-                "Chrome/122.0.0.0 Safari/537.36"
-            ),
-            locale="ko-KR",
-        )
-        page = context.new_page()
-        page.set_default_timeout(DEFAULT_TIMEOUT_MS)
-
-        sites = [
-            ("olens", "오렌즈", lambda: scrape_olens(page)),
-            ("hapakristin", "하파크리스틴", None),  # 특별 처리
-            ("lensme", "렌즈미", lambda: scrape_lensme(page)),
-            ("myfipn", "마이피픈", lambda: scrape_myfipn(page)),
-            ("chuulens", "츄렌즈", lambda: scrape_chuulens(page)),
-            ("gemhour", "젬아워", lambda: scrape_gemhour(page)),
-            ("isha", "아이샤", lambda: scrape_isha(page)),
-            ("lenbling", "렌블링", lambda: scrape_lenbling(page)),
-            ("yourly", "유어리", lambda: scrape_yourly(page)),
-            ("idol", "아이돌렌즈", lambda: scrape_idol(page)),
-            ("ann365", "앤365", None),  # 특별 처리
-        ]
-
-        for site_key, site_name, fn in sites:
-            print(f"[main] site: {site_name} ( {site_name} )")
-
-            t0 = time.time()
-            items: List[Item] = []
-            hard_fail = False
+    # 목록 사이트 item_id를 URL 기준으로 바꾼 뒤 첫 실행에서 기존 항목이 재알림되지 않도록 변환
+    had_any_state_change = migrate_url_id_seen(seen)
 
-            try:
-                if site_key == "hapakristin":
-                    items, hard_fail = scrape_hapakristin(page)
-                elif site_key == "ann365":
-                    items, hard_fail = scrape_ann365(page)
-                else:
-                    items = fn() if fn else []
-            except PWTimeoutError as e:
-                hard_fail = True
-                save_debug_text(f"{site_key}_timeout", str(e))
-            except Exception as e:
-                hard_fail = True
-                save_debug_text(f"{site_key}_exception", repr(e))
-
-            elapsed = time.time() - t0
-            print(f"[main] scraped: {len(items)} elapsed={elapsed:.1f}s")
-
-            # 신규 감지
-            site_seen = seen.get(site_key, {})
-            if not isinstance(site_seen, dict):
-                site_seen = {}
-
-            new_this_site: List[Item] = []
-            for it in items:
-                if it.item_id not in site_seen:
-                    new_this_site.append(it)
-                    site_seen[it.item_id] = {
-                        "title": it.title,
-                        "url": it.url,
-                        "first_seen": now_kst_str(),
-                    }
-
-            if new_this_site:
-                had_any_state_change = True
-                new_items_all.extend(new_this_site)
-
-            seen[site_key] = site_seen
-            print(f"[main] new: {len(new_this_site)}")
-
-            # “하드 실패”만으로는 곧장 경고하지 않음.
-            # 경고는 “debug 파일이 새로 생성된 경우에만” 보내고,
-            # 그마저도 이미 보낸 debug 파일은 재전송하지 않음.
-            # (아래에서 일괄 처리)
+    dns_task = asyncio.create_task(prewarm_dns(SITE_HOSTS))
 
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(headless=True, args=CHROMIUM_ARGS)
         try:
-            context.close()
+            # context는 사이트마다 만들지 않고 동시 수집 수만큼만 만들어 돌려 씀
+            pool: asyncio.Queue = asyncio.Queue()
+            contexts = await asyncio.gather(*[
+                new_context(browser) for _ in range(min(MAX_CONCURRENCY, len(SITES)))
+            ])
+            for ctx in contexts:
+                pool.put_nowait(ctx)
+            try:
+                await asyncio.wait_for(dns_task, DNS_PREWARM_WAIT_SEC)
+            except asyncio.TimeoutError:
+                pass
+
+            # 사이트들은 서로 독립적이고 대부분 네트워크 대기이므로 동시에 수집
+            # (결과 순서는 SITES 순서 유지)
+            results = await asyncio.gather(*[
+                run_site(browser, pool, site_key, site_name, fn)
+                for site_key, site_name, fn in SITES
+            ])
         finally:
-            browser.close()
-
-    # 상태 저장
-    save_json(SEEN_FILE, seen)
-
-    # 운영 채널: 신규만 알림
+            # 남은 context는 browser와 함께 닫힘
+            await browser.close()
+
+    # 신규 감지(상태 변경은 수집이 모두 끝난 뒤 여기서만)
+    first_seen = now_kst_str()
+    for (site_key, site_name, _), (items, hard_fail) in zip(SITES, results):
+        site_seen = seen.get(site_key, {})
+        if not isinstance(site_seen, dict):
+            site_seen = {}
+
+        new_this_site: List[Item] = []
+        for it in items:
+            if it.item_id not in site_seen:
+                new_this_site.append(it)
+                site_seen[it.item_id] = first_seen
+
+        if new_this_site:
+            had_any_state_change = True
+            new_items_all.extend(new_this_site)
+
+        if len(site_seen) > SEEN_MAX_PER_SITE:
+            # 이번에 수집된(= 아직 페이지에 있는) 항목은 남기고, 사라진 것 중 오래된 것부터 버림
+            # (계속 떠 있는 메뉴/장기 이벤트를 버리면 다음 실행에서 신규로 재알림됨)
+            current = {it.item_id for it in items}
+            excess = len(site_seen) - SEEN_MAX_PER_SITE
+            stale = [k for k in site_seen if k not in current][:excess]
+            for k in stale:
+                del site_seen[k]
+
+        seen[site_key] = site_seen
+        print(f"[main][{site_key}] new: {len(new_this_site)}")
+
+        # “하드 실패”만으로는 곧장 경고하지 않음.
+        # 경고는 “debug 파일이 새로 생성된 경우에만” 보내고,
+        # 그마저도 이미 보낸 debug 파일은 재전송하지 않음.
+        # (아래에서 일괄 처리)
+
+    # 운영 채널: 신규만 알림(전송은 백그라운드, 그동안 상태 저장/debug 정리 진행)
     if new_items_all:
         msg = format_new_items_message(new_items_all)
-        post_slack(OPS_WEBHOOK, msg)
+        notify_q.put_nowait((OPS_WEBHOOK, msg))
+
+    # 상태 저장(신규가 없으면 seen은 그대로라 직렬화 자체를 생략)
+    if had_any_state_change:
+        save_json(SEEN_FILE, seen)
 
     # debug 경고: “새로 생성된 debug 파일”만 + “미통지 파일”만
     debug_after = set(list_debug_files())
@@ -641,41 +1225,33 @@ def main():
     if created_unnotified and TEST_WEBHOOK:
         buckets: Dict[str, List[str]] = {}
         for fn in created_unnotified:
-            low = fn.lower()
-            if low.startswith("hapakristin_"):
-                buckets.setdefault("하파크리스틴", []).append(fn)
-            elif low.startswith("ann365_"):
-                buckets.setdefault("앤365", []).append(fn)
-            elif low.startswith("olens_"):
-                buckets.setdefault("오렌즈", []).append(fn)
-            elif low.startswith("lensme_"):
-                buckets.setdefault("렌즈미", []).append(fn)
-            elif low.startswith("myfipn_"):
-                buckets.setdefault("마이핍앤", []).append(fn)
-            elif low.startswith("chuulens_"):
-                buckets.setdefault("츄렌즈", []).append(fn)
-            elif low.startswith("gemhour_"):
-                buckets.setdefault("젬아워", []).append(fn)
-            elif low.startswith("isha_"):
-                buckets.setdefault("아이샤", []).append(fn)
-            elif low.startswith("lenbling_"):
-                buckets.setdefault("렌블링", []).append(fn)
-            elif low.startswith("yourly_"):
-                buckets.setdefault("유어리", []).append(fn)
-            elif low.startswith("idol_"):
-                buckets.setdefault("아이돌렌즈", []).append(fn)
-            else:
-                buckets.setdefault("기타", []).append(fn)
+            prefix, sep, _ = fn.lower().partition("_")
+            name = SITE_NAMES.get(prefix) if sep else None
+            buckets.setdefault(name or "기타", []).append(fn)
 
-        for site_name, files in buckets.items():
-            post_slack(TEST_WEBHOOK, format_debug_warning(site_name, files))
+        notify_q.put_nowait((TEST_WEBHOOK, format_debug_warning(buckets)))
 
         # 통지 기록 업데이트
         for fn in created_unnotified:
             debug_notified.add(fn)
-        save_json(DEBUG_NOTIFIED_FILE, sorted(list(debug_notified)))
+
+    # 오래된 debug 정리 + 이미 지워진 파일의 통지 기록도 정리
+    # (새 debug 파일명은 타임스탬프가 붙어 겹치지 않으므로 지운 파일 기록은 필요 없음)
+    remaining = set(prune_debug_files(DEBUG_KEEP_MAX))
+    debug_notified &= remaining
+    save_json(DEBUG_NOTIFIED_FILE, sorted(list(debug_notified)))
+
+async def main():
+    notify_q: asyncio.Queue = asyncio.Queue()
+    notifier = asyncio.create_task(slack_notifier(notify_q))
+    try:
+        await run_once(notify_q)
+    finally:
+        # 남은 알림 전송이 끝날 때까지 대기(상태 저장/debug 정리에서 예외가 나도 이미 넣은 알림은 전송)
+        notify_q.put_nowait(None)
+        await notifier
 
     print("[main] done")
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())